@@ -21,6 +21,12 @@ class _QiYield(Exception):
 
 class _QiNotifierImpl(_QiNotifier):
 
+    # __weakref__ is needed because PyQt holds a weak reference to the
+    # receiver of a bound method connected to a signal.
+    __slots__ = (
+        '_loop', '_qi_object', '_signal_handler_installed', '__weakref__',
+    )
+
     def __init__(self, loop: "QiBaseEventLoop", qi_object):
         # The following creates a reference cycle.  Call close() to
         # break the cycle.
@@ -184,6 +190,13 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
         # loop is running in EXCLUSIVE mode.
         self.__processing = False
 
+        # __selector_busy is set to True when the last _run_once yielded
+        # because select() is waiting for IO in a worker thread, and is
+        # reset when the next iteration starts.  Callbacks scheduled from
+        # interleaved code only need to wake up the selector in this case;
+        # otherwise an iteration is already pending.
+        self.__selector_busy = False
+
         # Any exception raised by self._process_asyncio_events is stored
         # in __run_once_error to be propagated later to the caller of
         # self.run_forever, as QEventLoop.exec() does not propagate
@@ -290,6 +303,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
                 pass
             else:
                 self._selector.set_notifier(None)
+            self.__selector_busy = False
             self.__notifier.close()
             self.__notifier = None
 
@@ -312,6 +326,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
         # have passed the schedule time.  Run only once to avoid starving
         # the Qt event loop.
         try:
+            self.__selector_busy = False
             self.__processing = True
             try:
                 self._run_once()
@@ -320,6 +335,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
             finally:
                 self.__processing = False
         except _QiYield:
+            self.__selector_busy = True
             # Ignore _stopping flag until select() returns.  This follows
             # asyncio behavior.
             # TODO: but this should not happen, because 0 timeout is passed
@@ -373,6 +389,14 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
                 # Schedule next iteration if this iteration did not block
                 self.__notifier.notify()
 
+    def __wakeup_selector(self) -> None:
+        """Wake up the selector if it is waiting for IO in a worker thread,
+        so that a callback scheduled from interleaved code is processed
+        without waiting for IO or timeout.  If the selector is not busy,
+        the next iteration is already scheduled and no wakeup is needed."""
+        if self.__selector_busy:
+            self._write_to_self()
+
     def _qi_loop_interrupt(self, exc: BaseException):
         """Terminate the loop abnormally with the given exception.
 
@@ -436,7 +460,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
 
         assert self.__mode == QiLoopMode.OWNER
 
-        from .bindings import QtCore
+        from .bindings import QtCore, _qeventloop_exec
         if QtCore.QCoreApplication.instance() is None:
             # TODO: do we need the same check in start()?
             raise RuntimeError('An instance of QCoreApplication or its '
@@ -446,10 +470,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
         try:
             self._qi_loop_startup()
             self.__qt_event_loop = QtCore.QEventLoop()
-            if hasattr(QtCore.QEventLoop, 'exec'):
-                exit_code = self.__qt_event_loop.exec()
-            else:
-                exit_code = self.__qt_event_loop.exec_()
+            exit_code = _qeventloop_exec(self.__qt_event_loop)
             if exit_code != 0:
                 # Propagate exception from _qi_loop_iteration() if
                 # one is set.  The exception is not set if the Qt loop
@@ -527,7 +548,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
 
         elif self.__mode == QiLoopMode.OWNER:
             if self.is_running() and not self.__processing:
-                self._write_to_self()
+                self.__wakeup_selector()
             super().stop()
 
         else:
@@ -539,7 +560,7 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
             elif self.__processing:
                 super().stop()
             else:
-                self._write_to_self()
+                self.__wakeup_selector()
                 super().stop()  # this only sets the flag
                 self._qi_loop_cleanup()
 
@@ -556,19 +577,21 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
     # _timer_handle_cancelled: see BaseEventLoop
 
     def call_soon(self, callback, *args, context=None):
-        # If called from interleaved code when the loop is SELECTING,
-        # treat as if called by call_soon_threadsafe().
-        if self.is_running() and not self.__processing:
+        # If called from interleaved code when the selector is busy,
+        # treat as if called by call_soon_threadsafe().  __selector_busy
+        # implies the loop is RUNNING and SELECTING, so callbacks (which
+        # are PROCESSING) pay only this one attribute read.
+        if self.__selector_busy:
             self._write_to_self()
         return super().call_soon(callback, *args, context=context)
 
     def call_later(self, delay, callback, *args, context=None):
-        if self.is_running() and not self.__processing:
+        if self.__selector_busy:
             self._write_to_self()
         return super().call_later(delay, callback, *args, context=context)
 
     def call_at(self, when, callback, *args, context=None):
-        if self.is_running() and not self.__processing:
+        if self.__selector_busy:
             self._write_to_self()
         return super().call_at(when, callback, *args, context=context)
 
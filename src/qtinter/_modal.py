@@ -25,7 +25,7 @@ def modal(fn):
             else:
                 future.set_result(result)
 
-        future = asyncio.Future()
+        future = loop.create_future()
         loop.exec_modal(modal_fn)
         return await asyncio.shield(future)
 
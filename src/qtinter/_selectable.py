@@ -11,6 +11,8 @@ class _QiNotifier(ABC):
     """An object responsible for the communication between a QiBaseEventLoop
     object and a _QiSelectable object."""
 
+    __slots__ = ()
+
     @abstractmethod
     def no_result(self) -> Any:
         """Called by the selectable object if no result is immediately
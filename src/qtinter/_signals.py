@@ -8,6 +8,23 @@ from ._helpers import transform_slot
 __all__ = 'asyncsignal', 'asyncsignalstream', 'multisignal',
 
 
+def _copy_signal_arguments_by_value(args):
+    # PyQt5/6 defines QVariant.  Signals without arguments need no copy.
+    if not args:
+        return args
+    return tuple([_QVariant(arg).value() for arg in args])
+
+
+def _copy_signal_arguments_by_reference(args):
+    # PySide2/6 doesn't define QVariant.
+    return args
+
+
+# Set to QtCore.QVariant on first call to copy_signal_arguments() if the
+# binding is PyQt5/6.
+_QVariant = None
+
+
 def copy_signal_arguments(args):
     """Return a value-copy of signal arguments where necessary.
 
@@ -19,13 +36,19 @@ def copy_signal_arguments(args):
 
     PySide2/6 already passes a copy of the signal arguments to slots,
     with proper reference counting.  There is no need to copy arguments.
+
+    The binding is fixed once imported, so the first call replaces this
+    function (as a module attribute) with the implementation for that
+    binding.  Subsequent calls skip the binding check.
     """
+    global copy_signal_arguments, _QVariant
     from .bindings import QtCore
     if hasattr(QtCore, 'QVariant'):
-        # PyQt5/6 defines QVariant; PySide2/6 doesn't.
-        return tuple(QtCore.QVariant(arg).value() for arg in args)
+        _QVariant = QtCore.QVariant
+        copy_signal_arguments = _copy_signal_arguments_by_value
     else:
-        return args
+        copy_signal_arguments = _copy_signal_arguments_by_reference
+    return copy_signal_arguments(args)
 
 
 async def asyncsignal(signal):
@@ -39,7 +62,7 @@ async def asyncsignal(signal):
     # for the 'destroyed' signal.
     from .bindings import _QiSlotObject
 
-    fut = asyncio.Future()
+    fut = asyncio.get_running_loop().create_future()
 
     def handler(*args):
         nonlocal slot
@@ -44,6 +44,14 @@ else:
     raise ImportError(f"unsupported QTINTERBINDING value '{binding}'")
 
 
+# QEventLoop.exec_() is renamed to exec() in Qt6 bindings.  Resolve the
+# method once; run_forever calls it each time a loop is run.
+if hasattr(QtCore.QEventLoop, 'exec'):
+    _qeventloop_exec = QtCore.QEventLoop.exec
+else:
+    _qeventloop_exec = QtCore.QEventLoop.exec_
+
+
 def __getattr__(name: str):
     # Support e.g. from qtinter.bindings import QtWidgets
     if name.startswith('__'):
@@ -54,6 +62,8 @@ def __getattr__(name: str):
 class _QiObjectImpl:
     """Helper object to invoke callbacks on the Qt event loop."""
 
+    __slots__ = '_timer', '_emit',
+
     def __init__(self):
         # "Reuse" QtCore.QTimer.timeout as a parameterless signal.
         # Previous attempts to create a custom QObject with a custom signal
@@ -61,6 +71,10 @@ class _QiObjectImpl:
         # (Python 3.7, macOS, PySide6).
         self._timer = QtCore.QTimer()
 
+        # invoke_callbacks() is called once per loop iteration.  Bind the
+        # signal once rather than creating a bound signal object per call.
+        self._emit = self._timer.timeout.emit
+
     def add_callback(self, callback):
         # Make queued connection to avoid re-entrance.
         self._timer.timeout.connect(
@@ -70,7 +84,7 @@ class _QiObjectImpl:
         self._timer.timeout.disconnect(callback)
 
     def invoke_callbacks(self):
-        self._timer.timeout.emit()
+        self._emit()
 
 
 class _QiSlotObject(QtCore.QObject):
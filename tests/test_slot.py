@@ -1,9 +1,11 @@
 """ test_slot.py - test the asyncslot() function """
 
 import asyncio
+import collections
+import contextlib
 import sys
 import unittest
-from shim import QtCore, Signal, Slot, is_pyqt
+from shim import QtCore, Signal, Slot, is_pyqt, exec_qt_loop
 from qtinter import asyncslot, using_asyncio_from_qt
 
 
@@ -11,7 +13,8 @@ class SenderObject(QtCore.QObject):
     signal = Signal(bool)
 
 
-called = []
+# Log of slot invocations; cleared and refilled by every _test_slot() call.
+called = collections.deque()
 
 
 def visit(s, tag=None):
@@ -28,31 +31,73 @@ qt_slot_supports_descriptor = not QtCore.__name__.startswith('PyQt')
 
 
 class TestMixin:
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The QCoreApplication, sender and asyncio event loop are reused by
+        # every test in the class; each test only connects and disconnects
+        # its slot.  Keeping the application alive beyond the class makes
+        # PyQt report ignored WeakMethod callback errors at exit.
         if QtCore.QCoreApplication.instance() is not None:
-            self.app = QtCore.QCoreApplication.instance()
+            cls.app = QtCore.QCoreApplication.instance()
         else:
-            self.app = QtCore.QCoreApplication([])
+            cls.app = QtCore.QCoreApplication([])
+        cls.sender = SenderObject()
+        cls._stack = contextlib.ExitStack()
+        try:
+            cls._stack.enter_context(using_asyncio_from_qt())
+            cls.loop = asyncio.get_running_loop()
+        except BaseException:
+            # tearDownClass is not called if setUpClass raises.
+            cls._stack.close()
+            raise
 
-    def tearDown(self):
-        self.app = None
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop = None
+        cls._stack.close()
+        cls.sender = None
+        cls.app = None
 
     def _test_slot(self, slot):
-
-        loop = QtCore.QEventLoop()
-        QtCore.QTimer.singleShot(0, loop.quit)
-
-        sender = SenderObject()
-        sender.signal.connect(slot, QtCore.Qt.ConnectionType.QueuedConnection)
-        sender.signal.emit(True)
-
-        called.clear()
-        with using_asyncio_from_qt():
-            if hasattr(loop, 'exec'):
-                loop.exec()
-            else:
-                loop.exec_()
-        return called.copy()
+        self.sender.signal.connect(
+            slot, QtCore.Qt.ConnectionType.QueuedConnection)
+        try:
+            called.clear()
+            self.sender.signal.emit(True)
+
+            # Deliver the queued signal, which runs the first step of the
+            # slot.  The remainder of the slot (after 'await
+            # asyncio.sleep(0)') is then scheduled on the loop; schedule a
+            # marker after it and process events until the marker runs.
+            QtCore.QCoreApplication.processEvents()
+            done = []
+            self.loop.call_soon(done.append, True)
+            # Give up after a deadline rather than hang if the marker never
+            # runs; the single-shot timer wakes processEvents() when due.
+            deadline = QtCore.QTimer()
+            deadline.setSingleShot(True)
+            deadline.start(5000)
+            while not done:
+                if not deadline.isActive():
+                    self.fail("slot did not complete within 5 seconds")
+                QtCore.QCoreApplication.processEvents(
+                    QtCore.QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+            deadline.stop()
+        finally:
+            self.sender.signal.disconnect(slot)
+        return list(called)
+
+    # Names of cases passed to _test_slots that the binding does not support.
+    unsupported_cases = ()
+
+    def _test_slots(self, cases, *args):
+        # Each case is a tuple (name, make_slot, expected), where
+        # make_slot(*args) returns the slot to test.
+        for name, make_slot, expected in cases:
+            with self.subTest(name=name):
+                if name in self.unsupported_cases:
+                    self.skipTest(f"not supported by {QtCore.__name__}")
+                self.assertEqual(self._test_slot(make_slot(*args)), expected)
 
 
 # =============================================================================
@@ -98,40 +143,33 @@ async def decorated_slot_afunc():
 class TestFreeFunction(TestMixin, unittest.TestCase):
 
     # -------------------------------------------------------------------------
-    # Test async free function without Slot decoration
-    # -------------------------------------------------------------------------
-
-    def test_wrapped_afunc(self):
-        result = self._test_slot(asyncslot(afunc))
-        self.assertEqual(result, ['afunc.1', 'afunc.2'])
-
-    def test_decorated_afunc(self):
-        result = self._test_slot(decorated_afunc)
-        self.assertEqual(result, ['decorated_afunc.1', 'decorated_afunc.2'])
-
-    # -------------------------------------------------------------------------
-    # Test async free function with Slot decoration
-    # -------------------------------------------------------------------------
-
-    def test_wrapped_slot_afunc(self):
-        self.assertEqual(self._test_slot(asyncslot(slot_afunc)),
-                         ['slot_afunc.1', 'slot_afunc.2'])
-
-    def test_decorated_slot_afunc(self):
-        self.assertEqual(self._test_slot(decorated_slot_afunc),
-                         ['decorated_slot_afunc.1', 'decorated_slot_afunc.2'])
-
-    def test_slot_decorated_afunc(self):
-        self.assertEqual(self._test_slot(slot_decorated_afunc),
-                         ['slot_decorated_afunc.1', 'slot_decorated_afunc.2'])
-
-    # -------------------------------------------------------------------------
-    # Test wrapped free function that's not apparently a coroutine function
+    # Test async free function with and without Slot decoration
     # -------------------------------------------------------------------------
 
-    def test_wrapped_afunc_indirect(self):
-        self.assertEqual(self._test_slot(asyncslot(lambda: afunc())),
-                         ['afunc.1', 'afunc.2'])
+    AFUNC_CASES = (
+        ('wrapped_afunc',
+         lambda: asyncslot(afunc),
+         ['afunc.1', 'afunc.2']),
+        ('decorated_afunc',
+         lambda: decorated_afunc,
+         ['decorated_afunc.1', 'decorated_afunc.2']),
+        ('wrapped_slot_afunc',
+         lambda: asyncslot(slot_afunc),
+         ['slot_afunc.1', 'slot_afunc.2']),
+        ('decorated_slot_afunc',
+         lambda: decorated_slot_afunc,
+         ['decorated_slot_afunc.1', 'decorated_slot_afunc.2']),
+        ('slot_decorated_afunc',
+         lambda: slot_decorated_afunc,
+         ['slot_decorated_afunc.1', 'slot_decorated_afunc.2']),
+        # Wrapped free function that's not apparently a coroutine function
+        ('wrapped_afunc_indirect',
+         lambda: asyncslot(lambda: afunc()),
+         ['afunc.1', 'afunc.2']),
+    )
+
+    def test_afunc(self):
+        self._test_slots(self.AFUNC_CASES)
 
     # -------------------------------------------------------------------------
     # Test invalid arguments to asyncslot
@@ -190,6 +228,10 @@ class TestFreeFunction(TestMixin, unittest.TestCase):
 
         self.assertEqual(self._test_slot(asyncslot(f)), [0])
 
+
+class TestFreeFunctionWithoutQtLoop(unittest.TestCase):
+    # These tests must not run within TestMixin's class-wide qtinter loop.
+
     # -------------------------------------------------------------------------
     # Test asyncslot without a loop
     # -------------------------------------------------------------------------
@@ -327,57 +369,58 @@ class TestReceiverObject(TestMixin, unittest.TestCase):
     # Test instance method
     # -------------------------------------------------------------------------
 
-    def test_wrapped_amethod(self):
-        self.assertEqual(self._test_slot(asyncslot(self.receiver.amethod)),
-                         ['amethod.1(Self)', 'amethod.2(Self)'])
-
-    def test_decorated_amethod(self):
-        self.assertEqual(
-            self._test_slot(self.receiver.decorated_amethod),
-            ['decorated_amethod.1(Self)', 'decorated_amethod.2(Self)'])
-
-    def test_wrapped_slot_amethod(self):
-        self.assertEqual(
-            self._test_slot(asyncslot(self.receiver.slot_amethod)),
-            ['slot_amethod.1(Self)', 'slot_amethod.2(Self)'])
-
-    def test_decorated_slot_amethod(self):
-        self.assertEqual(
-            self._test_slot(self.receiver.decorated_slot_amethod),
-            ['decorated_slot_amethod.1(Self)', 'decorated_slot_amethod.2(Self)'])
-
-    def test_slot_decorated_amethod(self):
-        self.assertEqual(
-            self._test_slot(self.receiver.slot_decorated_amethod),
-            ['slot_decorated_amethod.1(Self)', 'slot_decorated_amethod.2(Self)'])
+    INSTANCE_METHOD_CASES = (
+        ('wrapped_amethod',
+         lambda r: asyncslot(r.amethod),
+         ['amethod.1(Self)', 'amethod.2(Self)']),
+        ('decorated_amethod',
+         lambda r: r.decorated_amethod,
+         ['decorated_amethod.1(Self)', 'decorated_amethod.2(Self)']),
+        ('wrapped_slot_amethod',
+         lambda r: asyncslot(r.slot_amethod),
+         ['slot_amethod.1(Self)', 'slot_amethod.2(Self)']),
+        ('decorated_slot_amethod',
+         lambda r: r.decorated_slot_amethod,
+         ['decorated_slot_amethod.1(Self)', 'decorated_slot_amethod.2(Self)']),
+        ('slot_decorated_amethod',
+         lambda r: r.slot_decorated_amethod,
+         ['slot_decorated_amethod.1(Self)', 'slot_decorated_amethod.2(Self)']),
+    )
+
+    def test_instance_method(self):
+        self._test_slots(self.INSTANCE_METHOD_CASES, self.receiver)
 
     # -------------------------------------------------------------------------
     # Test class method
     # -------------------------------------------------------------------------
 
-    def test_wrapped_class_amethod(self):
-        self.assertEqual(
-            self._test_slot(asyncslot(self.receiver.class_amethod)),
-            ['class_amethod.1(Cls)', 'class_amethod.2(Cls)'])
+    CLASS_METHOD_CASES = (
+        ('wrapped_class_amethod',
+         lambda r: asyncslot(r.class_amethod),
+         ['class_amethod.1(Cls)', 'class_amethod.2(Cls)']),
+        ('class_decorated_amethod',
+         lambda r: r.class_decorated_amethod,
+         ['class_decorated_amethod.1(Cls)', 'class_decorated_amethod.2(Cls)']),
+    )
 
-    def test_class_decorated_amethod(self):
-        self.assertEqual(
-            self._test_slot(self.receiver.class_decorated_amethod),
-            ['class_decorated_amethod.1(Cls)', 'class_decorated_amethod.2(Cls)'])
+    def test_class_method(self):
+        self._test_slots(self.CLASS_METHOD_CASES, self.receiver)
 
     # -------------------------------------------------------------------------
     # Test static method
     # -------------------------------------------------------------------------
 
-    def test_wrapped_static_amethod(self):
-        self.assertEqual(
-            self._test_slot(asyncslot(self.receiver.static_amethod)),
-            ['static_amethod.1', 'static_amethod.2'])
+    STATIC_METHOD_CASES = (
+        ('wrapped_static_amethod',
+         lambda r: asyncslot(r.static_amethod),
+         ['static_amethod.1', 'static_amethod.2']),
+        ('static_decorated_amethod',
+         lambda r: r.static_decorated_amethod,
+         ['static_decorated_amethod.1', 'static_decorated_amethod.2']),
+    )
 
-    def test_static_decorated_amethod(self):
-        self.assertEqual(
-            self._test_slot(self.receiver.static_decorated_amethod),
-            ['static_decorated_amethod.1', 'static_decorated_amethod.2'])
+    def test_static_method(self):
+        self._test_slots(self.STATIC_METHOD_CASES, self.receiver)
 
 
 class TestReceiver(TestReceiverObject):
@@ -385,13 +428,8 @@ class TestReceiver(TestReceiverObject):
         super().setUp()
         self.receiver = Receiver()
 
-    @unittest.skipIf(is_pyqt, "not supported by PyQt")
-    def test_slot_decorated_amethod(self):
-        super().test_slot_decorated_amethod()
-
-    @unittest.skipIf(is_pyqt, "not supported by PyQt")
-    def test_decorated_slot_amethod(self):
-        super().test_decorated_slot_amethod()
+    if is_pyqt:
+        unsupported_cases = ('slot_decorated_amethod', 'decorated_slot_amethod')
 
 
 # =============================================================================
@@ -433,15 +471,16 @@ class StrongReceiver:
 
 
 class TestSlotBehavior(unittest.TestCase):
-
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         if QtCore.QCoreApplication.instance() is not None:
-            self.app = QtCore.QCoreApplication.instance()
+            cls.app = QtCore.QCoreApplication.instance()
         else:
-            self.app = QtCore.QCoreApplication([])
+            cls.app = QtCore.QCoreApplication([])
 
-    def tearDown(self):
-        self.app = None
+    @classmethod
+    def tearDownClass(cls):
+        cls.app = None
 
     def test_weak_reference_decorated(self):
         # Connection with bounded decorated method holds weak reference.
@@ -603,14 +642,16 @@ class Widget(QtCore.QObject):
 
 
 class TestSlotSelection(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         if QtCore.QCoreApplication.instance() is not None:
-            self.app = QtCore.QCoreApplication.instance()
+            cls.app = QtCore.QCoreApplication.instance()
         else:
-            self.app = QtCore.QCoreApplication([])
+            cls.app = QtCore.QCoreApplication([])
 
-    def tearDown(self):
-        self.app = None
+    @classmethod
+    def tearDownClass(cls):
+        cls.app = None
 
     def test_decorated(self):
         values1 = []
@@ -645,10 +686,7 @@ class TestSlotSelection(unittest.TestCase):
 
         with using_asyncio_from_qt():
             QtCore.QTimer.singleShot(0, callback)
-            if hasattr(self.app, "exec"):
-                self.app.exec()
-            else:
-                self.app.exec_()
+            exec_qt_loop(self.app)
 
         self.assertEqual(values1, ["control1", 12])
         self.assertEqual(values2, ["control2", "ha"])